@@ -26,6 +26,7 @@ The class supports merging.
 
 #include "RooStats/SamplingDistribution.h"
 #include "RooNumber.h"
+#include "RooAbsReal.h"
 #include "TMath.h"
 #include <algorithm>
 #include <iostream>
@@ -121,8 +122,16 @@ SamplingDistribution::SamplingDistribution(
       fVarName = varName;
    }
 
-   for(Int_t i=0; i < dataSet.numEntries(); i++) {
-      fSamplingDist.push_back(dataSet.get(i)->getRealValue(columnName));
+   const Int_t nEntries = dataSet.numEntries();
+   fSamplingDist.reserve(nEntries);
+   fSampleWeights.reserve(nEntries);
+
+   // get(i) loads each entry into the same RooArgSet, so the column only needs
+   // to be looked up once instead of by name for every entry
+   const RooAbsReal *column = dynamic_cast<const RooAbsReal *>(dataSet.get()->find(columnName));
+   for(Int_t i=0; i < nEntries; i++) {
+      const RooArgSet *entry = dataSet.get(i);
+      fSamplingDist.push_back(column ? column->getVal() : entry->getRealValue(columnName));
       fSampleWeights.push_back(dataSet.weight());
    }
 }
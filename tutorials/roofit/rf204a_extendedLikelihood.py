@@ -54,6 +54,11 @@ model = ROOT.RooAddPdf("model", "(g1+g2)+a", [bkg, sig], [nbkg, nsig])
 # Generate 1000 events from model so that nsig,nbkg come out to numbers <<500 in fit
 data = model.generate(x, 1000)
 
+# Number of processes over which the likelihood of each fit is parallelised.
+# Each process holds its own copy of the data and the model, so memory grows
+# with this number. Increase it on multi-core machines, e.g. to os.cpu_count().
+n_cpu = 1
+
 canv = ROOT.TCanvas("Canvas", "Canvas", 1500, 600)
 canv.Divide(3, 1)
 
@@ -63,20 +68,22 @@ canv.Divide(3, 1)
 # Perform unbinned ML fit to data, full range
 
 # IMPORTANT:
-# The model needs to be copied when fitting with different ranges because
-# the interpretation of the coefficients is tied to the fit range
-# that's used in the first fit
+# By default, range fits already interpret the coefficients in the full
+# domain of x. Fixing the model to a range spanning that full domain makes
+# plotOn use the same interpretation, so one model can be fitted and plotted
+# in all ranges below without making a copy for each range.
+x.setRange("fullRange", 0, 11)
+model.fixCoefRange("fullRange")
 canv.cd(1)
 
-model1 = ROOT.RooAddPdf(model)
-r = model1.fitTo(data, Save=True)
+r = model.fitTo(data, Save=True, NumCPU=(n_cpu, 0))
 r.Print()
 
 frame = x.frame(Title="Full range fitted")
 data.plotOn(frame)
-model1.plotOn(frame, VisualizeError=r)
-model1.plotOn(frame)
-model1.paramOn(frame)
+model.plotOn(frame, VisualizeError=r)
+model.plotOn(frame)
+model.paramOn(frame)
 frame.Draw()
 
 
@@ -87,15 +94,14 @@ canv.cd(2)
 x.setRange("left", 0.0, 4.0)
 x.setRange("right", 6.0, 10.0)
 
-model2 = ROOT.RooAddPdf(model)
-r2 = model2.fitTo(data, Range="left,right", Save=True)
+r2 = model.fitTo(data, Range="left,right", Save=True, NumCPU=(n_cpu, 0))
 r2.Print()
 
 frame2 = x.frame(Title="Fit in left/right sideband")
 data.plotOn(frame2)
-model2.plotOn(frame2, VisualizeError=r2)
-model2.plotOn(frame2)
-model2.paramOn(frame2)
+model.plotOn(frame2, VisualizeError=r2)
+model.plotOn(frame2)
+model.paramOn(frame2)
 frame2.Draw()
 
 
@@ -107,15 +113,14 @@ frame2.Draw()
 canv.cd(3)
 x.setRange("leftToMiddle", 0.0, 5.0)
 
-model3 = ROOT.RooAddPdf(model)
-r3 = model3.fitTo(data, Range="leftToMiddle", Save=True)
+r3 = model.fitTo(data, Range="leftToMiddle", Save=True, NumCPU=(n_cpu, 0))
 r3.Print()
 
 frame3 = x.frame(Title="Fit from left to middle")
 data.plotOn(frame3)
-model3.plotOn(frame3, VisualizeError=r3)
-model3.plotOn(frame3)
-model3.paramOn(frame3)
+model.plotOn(frame3, VisualizeError=r3)
+model.plotOn(frame3)
+model.paramOn(frame3)
 frame3.Draw()
 
 canv.Draw()
@@ -20,8 +20,9 @@ import ROOT
 # Read workspace from file
 # -----------------------------------------------
 
-# Open input file with workspace (generated by rf503_wspacewrite)
-f = ROOT.TFile("rf502_workspace_py.root")
+# Open input file with workspace (generated by rf503_wspacewrite).
+# TFile.Open also picks the right backend if the file is given as a remote URL.
+f = ROOT.TFile.Open("rf502_workspace_py.root")
 
 # Retrieve workspace from file
 w = f.Get("w")